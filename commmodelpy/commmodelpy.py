@@ -98,6 +98,9 @@ class SingleModel:
     )
     </pre>
     """
+    # Explicit __slots__ instead of dataclass(slots=True), which needs Python >= 3.10
+    __slots__ = ("cobra_model", "species_abbreviation", "objective_reaction_id", "exchange_reaction_id_prefix",
+                 "input_metabolite_ids", "output_metabolite_ids", "model_metabolite_to_exchange_id_mapping")
     cobra_model: cobra.Model
     species_abbreviation: str
     objective_reaction_id: str
@@ -160,6 +163,9 @@ class Community:
     )
     </pre>
     """
+    # Explicit __slots__ instead of dataclass(slots=True), which needs Python >= 3.10
+    __slots__ = ("single_models", "exchange_compartment_id", "exchange_reaction_id_prefix",
+                 "input_metabolite_ids", "output_metabolite_ids")
     single_models: List[SingleModel]
     exchange_compartment_id: str
     exchange_reaction_id_prefix: str
@@ -269,6 +275,134 @@ def community_model_fba_summary(model: cobra.Model, exchange_reaction_id_prefix:
 """
 
 
+def _add_species_suffix_to_ids(cobra_model: cobra.Model, species_abbreviation: str) -> None:
+    """Appends "_"+species_abbreviation to all metabolite and reaction IDs of the given cobrapy model.
+
+    Description
+    ----------
+    Setting the id of a metabolite or reaction which is part of a model lets cobrapy rebuild the model's whole
+    ID index for each single object. Here, all IDs are changed first (together with the names of their
+    solver constraints and variables) and the metabolite and reaction indices are rebuilt only once afterwards.
+    All new IDs are checked before anything is changed, so that a ValueError leaves the model untouched.
+
+    Arguments
+    ----------
+    * cobra_model: cobra.Model ~ The cobrapy model whose IDs are changed in-place.
+    * species_abbreviation: str ~ The species abbreviation which is used as ID suffix.
+    """
+    suffix = "_" + species_abbreviation
+    metabolites_with_new_ids = [(x, x.id + suffix) for x in cobra_model.metabolites]
+    reactions_with_new_ids = [(x, x.id + suffix) for x in cobra_model.reactions]
+    _check_new_ids(cobra_model.metabolites, metabolites_with_new_ids, "metabolite")
+    _check_new_ids(cobra_model.reactions, reactions_with_new_ids, "reaction")
+
+    # Rename metabolites
+    constraints = cobra_model.constraints
+    for metabolite, new_id in metabolites_with_new_ids:
+        constraints[metabolite.id].name = new_id
+        metabolite._id = new_id
+    cobra_model.metabolites._generate_index()
+
+    # Rename reactions
+    _set_reaction_ids(cobra_model, reactions_with_new_ids)
+
+
+def _check_new_ids(objects: cobra.DictList, objects_with_new_ids: List[Tuple[cobra.Object, str]], object_type: str) -> None:
+    """Raises a ValueError (as cobrapy's id setters do) if any of the given new IDs is already used.
+
+    Description
+    ----------
+    A new ID must neither be an ID which the given DictList already contains nor occur twice in the
+    given list. Also the current IDs of the renamed objects count as used, as the renamed solver
+    constraints and variables would otherwise overwrite each other during the renaming.
+
+    Arguments
+    ----------
+    * objects: cobra.DictList ~ The model's metabolites or reactions.
+    * objects_with_new_ids: List[Tuple[cobra.Object, str]] ~ A list of tuples with a metabolite or reaction
+      of the DictList and its new ID.
+    * object_type: str ~ "metabolite" or "reaction", used in the error message.
+    """
+    new_ids = set()
+    for _, new_id in objects_with_new_ids:
+        if (new_id in objects) or (new_id in new_ids):
+            raise ValueError(
+                f"The model already contains a {object_type} with the id: {new_id}")
+        new_ids.add(new_id)
+
+
+def _set_reaction_ids(cobra_model: cobra.Model, reactions_with_new_ids: List[Tuple[cobra.Reaction, str]]) -> None:
+    """Sets the IDs of the given reactions of the given cobrapy model while rebuilding the model's reaction index only once.
+
+    Description
+    ----------
+    Setting the id of a reaction which is part of a model lets cobrapy rebuild the model's whole reaction ID
+    index for each single reaction. Here, all IDs (and the names of the reactions' solver variables) are changed
+    first and the index is rebuilt only once afterwards. All new IDs are checked before any reaction is renamed,
+    so that a ValueError leaves the model untouched.
+
+    Arguments
+    ----------
+    * cobra_model: cobra.Model ~ The cobrapy model which contains the reactions.
+    * reactions_with_new_ids: List[Tuple[cobra.Reaction, str]] ~ A list of tuples with a reaction of the model
+      and the new ID of this reaction.
+    """
+    _check_new_ids(cobra_model.reactions, reactions_with_new_ids, "reaction")
+
+    for reaction, new_id in reactions_with_new_ids:
+        forward_variable = reaction.forward_variable
+        reverse_variable = reaction.reverse_variable
+        reaction._id = new_id
+        forward_variable.name = reaction.id
+        reverse_variable.name = reaction.reverse_id
+    cobra_model.reactions._generate_index()
+
+
+def _create_community_exchange_reactions(community: Community) -> List[cobra.Reaction]:
+    """Returns the whole community's exchange reactions, together with their exchange compartment metabolites.
+
+    Arguments
+    ----------
+    * community: Community ~ The Community instance whose input and output metabolites are exchanged.
+    """
+    exchange_compartment_id = community.exchange_compartment_id
+    exchange_reaction_id_prefix = community.exchange_reaction_id_prefix
+    input_metabolite_ids = set(community.input_metabolite_ids)
+    output_metabolite_ids = set(community.output_metabolite_ids)
+
+    community_exchange_reactions: List[cobra.Reaction] = []
+    for exchange_metabolite_id in list(input_metabolite_ids | output_metabolite_ids):
+        community_exchange_metabolite_id = f"{exchange_metabolite_id}_{exchange_compartment_id}"
+
+        # Set reaction instance
+        reaction = cobra.Reaction(id=f"{exchange_reaction_id_prefix}{community_exchange_metabolite_id}",
+                                  name=f"Community exchange for {exchange_metabolite_id}")
+
+        # Set reaction bounds
+        is_input = exchange_metabolite_id in input_metabolite_ids
+        if is_input:
+            reaction.lower_bound = -float("inf")
+        else:
+            reaction.lower_bound = 0
+        is_output = exchange_metabolite_id in output_metabolite_ids
+        if is_output:
+            reaction.upper_bound = float("inf")
+        else:
+            reaction.upper_bound = 0
+
+        # Add metabolite to reaction
+        exchange_metabolite = cobra.Metabolite(community_exchange_metabolite_id,
+                                               name=f"Exchange compartment metabolite {exchange_metabolite_id}",
+                                               compartment="exchange")
+        reaction.add_metabolites({
+            exchange_metabolite: -1,
+        })
+
+        community_exchange_reactions.append(reaction)
+
+    return community_exchange_reactions
+
+
 def generate_community_model_with_no_growth(community: Community, fractions: Dict[str, float], biomass_reactions: Dict[str, str] = {}) -> cobra.Model:
     """Creates a cobrapy-compatible community model from a commmodelpy Community instance.
 
@@ -327,22 +461,23 @@ def generate_community_model_with_no_growth(community: Community, fractions: Dic
             raise ValueError(
                 f"ERROR: Underscore in the given species abbreviation {single_model.species_abbreviation} D:")
 
-        # Rename metabolites
-        for metabolite in single_model.cobra_model.metabolites:
-            metabolite.id += "_" + single_model.species_abbreviation
+        # Rename metabolites and reactions
+        _add_species_suffix_to_ids(single_model.cobra_model, single_model.species_abbreviation)
 
-        # Rename reactions and change bounds
+        # Change reaction bounds
         for reaction in single_model.cobra_model.reactions:
-            reaction.id += "_" + single_model.species_abbreviation
-
-            if reaction.upper_bound != float("inf"):
-                reaction.upper_bound *= species_fraction
-            if reaction.lower_bound != -float("inf"):
-                reaction.lower_bound *= species_fraction
-            if (reaction.upper_bound == float("inf")) and (species_fraction == 0):
-                reaction.upper_bound = 0
-            if (reaction.lower_bound == -float("inf")) and (species_fraction == 0):
-                reaction.lower_bound = 0
+            # Calculate the fraction-scaled bounds first so that they are set
+            # with a single update of the reaction's solver variables
+            lower_bound, upper_bound = reaction.bounds
+            if upper_bound != float("inf"):
+                upper_bound *= species_fraction
+            if lower_bound != -float("inf"):
+                lower_bound *= species_fraction
+            if (upper_bound == float("inf")) and (species_fraction == 0):
+                upper_bound = 0
+            if (lower_bound == -float("inf")) and (species_fraction == 0):
+                lower_bound = 0
+            reaction.bounds = (lower_bound, upper_bound)
 
         # Delete standard exchange reactions with default exchange reaction ID prefix
         standard_exchanges = [x for x in single_model.cobra_model.reactions
@@ -350,94 +485,70 @@ def generate_community_model_with_no_growth(community: Community, fractions: Dic
         single_model.cobra_model.remove_reactions(standard_exchanges)
 
     # Merge single models into a huge one
-    merged_model = copy.deepcopy(community.single_models[0].cobra_model)
+    # (cobrapy's own model copy is much cheaper than a deepcopy of the whole model, and the copied
+    # reactions of all other single models are added at once instead of merging the models one by one)
+    merged_model = community.single_models[0].cobra_model.copy()
+    other_reactions: List[cobra.Reaction] = []
     for single_model in community.single_models[1:]:
-        merged_model.merge(single_model.cobra_model, inplace=True)
-
-    # Add whole community exchanges
-    exchange_metabolite_ids = list(
-        set(community.input_metabolite_ids + community.output_metabolite_ids))
-    for exchange_metabolite_id in exchange_metabolite_ids:
-        # Set reaction instance
-        reaction = cobra.Reaction(id=community.exchange_reaction_id_prefix+exchange_metabolite_id+"_"+community.exchange_compartment_id,
-                                  name="Community exchange for "+exchange_metabolite_id)
-
-        # Set reaction bounds
-        is_input = exchange_metabolite_id in community.input_metabolite_ids
-        if is_input:
-            reaction.lower_bound = -float("inf")
-        else:
-            reaction.lower_bound = 0
-        is_output = exchange_metabolite_id in community.output_metabolite_ids
-        if is_output:
-            reaction.upper_bound = float("inf")
-        else:
-            reaction.upper_bound = 0
-
-        # Add metabolite to reaction
-        exchange_metabolite = cobra.Metabolite(exchange_metabolite_id+"_"+community.exchange_compartment_id,
-                                               name="Exchange compartment metabolite "+exchange_metabolite_id,
-                                               compartment="exchange")
-        reaction.add_metabolites({
-            exchange_metabolite: -1,
-        })
-
-        # Add reaction to model
-        merged_model.add_reactions([reaction])
-
-    # Add mock community biomass metabolites for the ASTHERISC package's species recognition
-    biomass_metabolite = cobra.Metabolite(id="community_biomass",
-                                          name="Mock community biomass metabolite for ASTHERISC package species recognition",
-                                          compartment="exchg")
-    merged_model.add_metabolites([biomass_metabolite])
+        other_reactions += copy.deepcopy(single_model.cobra_model.reactions)
+    merged_model.add_reactions(other_reactions)
+
+    # Add all whole community exchanges to model at once
+    merged_model.add_reactions(_create_community_exchange_reactions(community))
+
+    # Add mock community and species biomass metabolites for the ASTHERISC package's species recognition at once
+    biomass_metabolites: List[cobra.Metabolite] = [
+        cobra.Metabolite(id=biomass_metabolite_id,
+                         name="Mock community biomass metabolite for ASTHERISC package species recognition",
+                         compartment="exchg")
+        for biomass_metabolite_id in ["community_biomass"] +
+        [f"community_biomass_{x.species_abbreviation}" for x in community.single_models]
+    ]
+    merged_model.add_metabolites(biomass_metabolites)
 
     # Add single species <-> exchange compartment exchanges
+    get_metabolite_by_id = merged_model.metabolites.get_by_id
+    species_exchange_reactions: List[cobra.Reaction] = []
+    exchange_compartment_id = community.exchange_compartment_id
     for single_model in community.single_models:
-        exchange_metabolite_ids = list(
-            set(single_model.input_metabolite_ids + single_model.output_metabolite_ids))
-        exchange_metabolite_ids = [
-            x+"_"+single_model.species_abbreviation for x in exchange_metabolite_ids]
-
-        # Add mock community biomass metabolites for the ASTHERISC package's species recognition
-        biomass_metabolite = cobra.Metabolite(id="community_biomass_"+single_model.species_abbreviation,
-                                              name="Mock community biomass metabolite for ASTHERISC package species recognition",
-                                              compartment="exchg")
-        merged_model.add_metabolites([biomass_metabolite])
+        species_abbreviation = single_model.species_abbreviation
+        input_metabolite_ids = set(single_model.input_metabolite_ids)
+        output_metabolite_ids = set(single_model.output_metabolite_ids)
 
-        for exchange_metabolite_id in exchange_metabolite_ids:
-            exchange_compartment_metabolite_id = single_model.model_metabolite_to_exchange_id_mapping[exchange_metabolite_id.replace(
-                "_"+single_model.species_abbreviation, "")]
+        for single_model_base_metabolite_id in list(input_metabolite_ids | output_metabolite_ids):
+            exchange_metabolite_id = f"{single_model_base_metabolite_id}_{species_abbreviation}"
+            exchange_compartment_metabolite_id = single_model.model_metabolite_to_exchange_id_mapping[single_model_base_metabolite_id]
 
             # Set reaction instance
-            reaction = cobra.Reaction(id="EXCHG_"+single_model.species_abbreviation+"_"+exchange_metabolite_id.replace("_"+single_model.species_abbreviation, "")+"_to_"+exchange_compartment_metabolite_id,
-                                      name=f"Exchange for {exchange_metabolite_id} from single species {single_model.species_abbreviation} to exchange compartment")
+            reaction = cobra.Reaction(id=f"EXCHG_{species_abbreviation}_{single_model_base_metabolite_id}_to_{exchange_compartment_metabolite_id}",
+                                      name=f"Exchange for {exchange_metabolite_id} from single species {species_abbreviation} to exchange compartment")
 
             # Set reaction bounds
-            # is_input = exchange_compartment_metabolite_id in single_model.input_metabolite_ids
-            is_input = exchange_metabolite_id.replace("_"+single_model.species_abbreviation, "") in single_model.input_metabolite_ids
+            is_input = single_model_base_metabolite_id in input_metabolite_ids
             if is_input:
                 reaction.lower_bound = -float("inf")
             else:
                 reaction.lower_bound = 0
-            # is_output = exchange_compartment_metabolite_id in single_model.output_metabolite_ids
-            is_output = exchange_metabolite_id.replace("_"+single_model.species_abbreviation, "") in single_model.output_metabolite_ids
+            is_output = single_model_base_metabolite_id in output_metabolite_ids
             if is_output:
                 reaction.upper_bound = float("inf")
             else:
                 reaction.upper_bound = 0
 
             # Add metabolites to reaction
-            internal_metabolite = merged_model.metabolites.get_by_id(
+            internal_metabolite = get_metabolite_by_id(
                 exchange_metabolite_id)
-            exchange_compartment_metabolite = merged_model.metabolites.get_by_id(
-                exchange_compartment_metabolite_id+"_"+community.exchange_compartment_id)
+            exchange_compartment_metabolite = get_metabolite_by_id(
+                f"{exchange_compartment_metabolite_id}_{exchange_compartment_id}")
             reaction.add_metabolites({
                 internal_metabolite: -1,
                 exchange_compartment_metabolite: 1,
             })
 
-            # Add reaction to model
-            merged_model.add_reactions([reaction])
+            species_exchange_reactions.append(reaction)
+
+    # Add all species exchange reactions to model at once
+    merged_model.add_reactions(species_exchange_reactions)
 
     return merged_model
 
@@ -541,13 +652,8 @@ def create_community_model_with_balanced_growth(community: Community, growth_rat
             raise ValueError(
                 f"ERROR: Underscore in the given species abbreviation {single_model.species_abbreviation} D:")
 
-        # Rename metabolites
-        for metabolite in single_model.cobra_model.metabolites:
-            metabolite.id += "_" + single_model.species_abbreviation
-
-        # Rename reactions and change bounds
-        for reaction in single_model.cobra_model.reactions:
-            reaction.id += "_" + single_model.species_abbreviation
+        # Rename metabolites and reactions
+        _add_species_suffix_to_ids(single_model.cobra_model, single_model.species_abbreviation)
 
         # Delete standard exchange reactions with default exchange reaction ID prefix
         standard_exchanges = [x for x in single_model.cobra_model.reactions
@@ -564,9 +670,13 @@ def create_community_model_with_balanced_growth(community: Community, growth_rat
         biomass_reaction.upper_bound = float("inf")
 
     # Merge single models into a huge one
-    merged_model = copy.deepcopy(community.single_models[0].cobra_model)
+    # (cobrapy's own model copy is much cheaper than a deepcopy of the whole model, and the copied
+    # reactions of all other single models are added at once instead of merging the models one by one)
+    merged_model = community.single_models[0].cobra_model.copy()
+    other_reactions: List[cobra.Reaction] = []
     for single_model in community.single_models[1:]:
-        merged_model.merge(single_model.cobra_model, inplace=True)
+        other_reactions += copy.deepcopy(single_model.cobra_model.reactions)
+    merged_model.add_reactions(other_reactions)
 
     # Add community biomass metabolite
     community_biomass_metabolite = cobra.Metabolite(
@@ -579,36 +689,8 @@ def create_community_model_with_balanced_growth(community: Community, growth_rat
             community_biomass_metabolite: 1,
         })
 
-    # Add whole community exchanges
-    exchange_metabolite_ids = list(
-        set(community.input_metabolite_ids + community.output_metabolite_ids))
-    for exchange_metabolite_id in exchange_metabolite_ids:
-        # Set reaction instance
-        reaction = cobra.Reaction(id=community.exchange_reaction_id_prefix+exchange_metabolite_id+"_"+community.exchange_compartment_id,
-                                  name="Community exchange for "+exchange_metabolite_id)
-
-        # Set reaction bounds
-        is_input = exchange_metabolite_id in community.input_metabolite_ids
-        if is_input:
-            reaction.lower_bound = -float("inf")
-        else:
-            reaction.lower_bound = 0
-        is_output = exchange_metabolite_id in community.output_metabolite_ids
-        if is_output:
-            reaction.upper_bound = float("inf")
-        else:
-            reaction.upper_bound = 0
-
-        # Add metabolite to reaction
-        exchange_metabolite = cobra.Metabolite(exchange_metabolite_id+"_"+community.exchange_compartment_id,
-                                               name="Exchange compartment metabolite "+exchange_metabolite_id,
-                                               compartment="exchange")
-        reaction.add_metabolites({
-            exchange_metabolite: -1,
-        })
-
-        # Add reaction to model
-        merged_model.add_reactions([reaction])
+    # Add all whole community exchanges to model at once
+    merged_model.add_reactions(_create_community_exchange_reactions(community))
 
     # Split reversible reactions
     merged_model = split_reversible_organism_reactions(
@@ -624,41 +706,46 @@ def create_community_model_with_balanced_growth(community: Community, growth_rat
     })
 
     # Add single species <-> exchange compartment exchanges
+    # (all metabolite IDs are tracked in a set so that missing metabolites are found without failing lookups)
+    known_metabolite_ids = set(x.id for x in merged_model.metabolites)
+    get_metabolite_by_id = merged_model.metabolites.get_by_id
+    new_exchange_compartment_metabolites: Dict[str, cobra.Metabolite] = {}
+    species_exchange_reactions: List[cobra.Reaction] = []
+    exchange_compartment_id = community.exchange_compartment_id
     for single_model in community.single_models:
-        exchange_metabolite_ids = list(
-            set(single_model.input_metabolite_ids + single_model.output_metabolite_ids))
-        exchange_metabolite_ids = [
-            x+"_"+single_model.species_abbreviation for x in exchange_metabolite_ids]
+        species_abbreviation = single_model.species_abbreviation
+        input_metabolite_ids = set(single_model.input_metabolite_ids)
+        output_metabolite_ids = set(single_model.output_metabolite_ids)
 
-        for exchange_metabolite_id in exchange_metabolite_ids:
-            single_model_base_metabolite_id = exchange_metabolite_id.replace("_"+single_model.species_abbreviation, "")
+        for single_model_base_metabolite_id in list(input_metabolite_ids | output_metabolite_ids):
+            exchange_metabolite_id = f"{single_model_base_metabolite_id}_{species_abbreviation}"
             exchange_compartment_metabolite_id = single_model.model_metabolite_to_exchange_id_mapping[single_model_base_metabolite_id]
 
             # Add metabolites to reaction
-            try:
-                internal_metabolite = merged_model.metabolites.get_by_id(
+            if exchange_metabolite_id in known_metabolite_ids:
+                internal_metabolite = get_metabolite_by_id(
                     exchange_metabolite_id)
-            except:
+            else:
                 print("ERROR: Internal exchange metabolite ID " + exchange_metabolite_id + "does not exist!")
-            species_exchange_metabolite_id = exchange_compartment_metabolite_id+"_"+community.exchange_compartment_id
-            try:
-                exchange_compartment_metabolite = merged_model.metabolites.get_by_id(
+            species_exchange_metabolite_id = f"{exchange_compartment_metabolite_id}_{exchange_compartment_id}"
+            if species_exchange_metabolite_id in known_metabolite_ids:
+                exchange_compartment_metabolite = get_metabolite_by_id(
                     species_exchange_metabolite_id)
-            except:
-                new_species_exchange_metabolite = cobra.Metabolite(id=species_exchange_metabolite_id,
+            elif species_exchange_metabolite_id in new_exchange_compartment_metabolites:
+                exchange_compartment_metabolite = new_exchange_compartment_metabolites[species_exchange_metabolite_id]
+            else:
+                exchange_compartment_metabolite = cobra.Metabolite(id=species_exchange_metabolite_id,
                     compartment="exchg")
-                merged_model.add_metabolites(new_species_exchange_metabolite)
-                exchange_compartment_metabolite = merged_model.metabolites.get_by_id(
-                    species_exchange_metabolite_id)
+                new_exchange_compartment_metabolites[species_exchange_metabolite_id] = exchange_compartment_metabolite
 
             # Set reaction bounds
-            is_input = single_model_base_metabolite_id in single_model.input_metabolite_ids
-            is_output = single_model_base_metabolite_id in single_model.output_metabolite_ids
+            is_input = single_model_base_metabolite_id in input_metabolite_ids
+            is_output = single_model_base_metabolite_id in output_metabolite_ids
 
             # Set reaction instance
             if is_input:
-                reaction_in = cobra.Reaction(id="EXCHG_in_"+single_model.species_abbreviation+"_"+exchange_metabolite_id.replace("_"+single_model.species_abbreviation, "")+"_to_"+exchange_compartment_metabolite_id,
-                                      name=f"Input exchange for {exchange_metabolite_id} from single species {single_model.species_abbreviation} to exchange compartment")
+                reaction_in = cobra.Reaction(id=f"EXCHG_in_{species_abbreviation}_{single_model_base_metabolite_id}_to_{exchange_compartment_metabolite_id}",
+                                      name=f"Input exchange for {exchange_metabolite_id} from single species {species_abbreviation} to exchange compartment")
                 reaction_in.add_metabolites({
                     exchange_compartment_metabolite: -1,
                     internal_metabolite: 1,
@@ -666,10 +753,10 @@ def create_community_model_with_balanced_growth(community: Community, growth_rat
                 reaction_in.lower_bound = 0
                 reaction_in.upper_bound = 1000
 
-                merged_model.add_reactions([reaction_in])
+                species_exchange_reactions.append(reaction_in)
             if is_output:
-                reaction_out = cobra.Reaction(id="EXCHG_out_"+single_model.species_abbreviation+"_"+exchange_metabolite_id.replace("_"+single_model.species_abbreviation, "")+"_to_"+exchange_compartment_metabolite_id,
-                                      name=f"Output exchange for {exchange_metabolite_id} from single species {single_model.species_abbreviation} to exchange compartment")
+                reaction_out = cobra.Reaction(id=f"EXCHG_out_{species_abbreviation}_{single_model_base_metabolite_id}_to_{exchange_compartment_metabolite_id}",
+                                      name=f"Output exchange for {exchange_metabolite_id} from single species {species_abbreviation} to exchange compartment")
                 reaction_out.add_metabolites({
                     internal_metabolite: -1,
                     exchange_compartment_metabolite: 1,
@@ -677,35 +764,43 @@ def create_community_model_with_balanced_growth(community: Community, growth_rat
                 reaction_out.lower_bound = 0
                 reaction_out.upper_bound = float("inf")
 
-                merged_model.add_reactions([reaction_out])
+                species_exchange_reactions.append(reaction_out)
+
+    # Add all new exchange compartment metabolites and species exchange reactions to model at once
+    merged_model.add_metabolites(list(new_exchange_compartment_metabolites.values()))
+    merged_model.add_reactions(species_exchange_reactions)
 
     # Add organism-specific reaction bounds
-    bound_reaction_ids = [x.id for x in merged_model.reactions
-                          if x.id in list(organism_exchange_bounds.keys())]
-    for bound_reaction_id in bound_reaction_ids:
-        lower_bound = organism_exchange_bounds[bound_reaction_id][0]
-        upper_bound = organism_exchange_bounds[bound_reaction_id][1]
-        reaction = merged_model.reactions.get_by_id(bound_reaction_id)
-        reaction.lower_bound = lower_bound
-        reaction.upper_bound = upper_bound
+    # (the dictionary's hashed key lookup avoids a scan of all bound IDs per model reaction)
+    bound_reactions = [x for x in merged_model.reactions
+                       if x.id in organism_exchange_bounds]
+    for reaction in bound_reactions:
+        lower_bound = organism_exchange_bounds[reaction.id][0]
+        upper_bound = organism_exchange_bounds[reaction.id][1]
+        reaction.bounds = (lower_bound, upper_bound)
 
     # Add minimal and maximal bound constraints using pseudo-metabolites and pseudo-reactions
-    reaction_ids = [x.id for x in merged_model.reactions]
-    for reaction_id in reaction_ids:
-        reaction = merged_model.reactions.get_by_id(reaction_id)
+    # (the pseudo-reactions are only added after this loop, so that the model's reactions can be iterated directly)
+    pseudo_reactions: List[cobra.Reaction] = []
+    organism_ids = frozenset(organism_id_biomass_reaction_id_mapping.keys())
+    organism_biomass_reactions: Dict[str, cobra.Reaction] = {
+        organism_id: merged_model.reactions.get_by_id(biomass_reaction_id)
+        for organism_id, biomass_reaction_id in organism_id_biomass_reaction_id_mapping.items()
+    }
+    for reaction in merged_model.reactions:
+        reaction_id = reaction.id
 
         # Check organism ID
         if reaction_id.startswith("EXCHG"):
-            reaction_organism_id = reaction.id.split("_")[2]
-            if reaction_organism_id not in organism_id_biomass_reaction_id_mapping.keys():
+            reaction_organism_id = reaction_id.split("_", 3)[2]
+            if reaction_organism_id not in organism_ids:
                 continue
         else:
-            reaction_organism_id = reaction.id.split("_")[-1]
-            if reaction_organism_id not in organism_id_biomass_reaction_id_mapping.keys():
+            reaction_organism_id = reaction_id.rpartition("_")[2]
+            if reaction_organism_id not in organism_ids:
                 continue
 
-        organism_biomass_reaction = merged_model.reactions.get_by_id(
-            organism_id_biomass_reaction_id_mapping[reaction_organism_id])
+        organism_biomass_reaction = organism_biomass_reactions[reaction_organism_id]
         # Add maximal bound constraint
         if reaction.upper_bound != float("inf"):
             # Add ~M
@@ -726,7 +821,7 @@ def create_community_model_with_balanced_growth(community: Community, growth_rat
             new_reaction.add_metabolites({
                 new_metabolite: 1,
             })
-            merged_model.add_reactions([new_reaction])
+            pseudo_reactions.append(new_reaction)
 
             reaction.upper_bound = float("inf")
 
@@ -750,10 +845,13 @@ def create_community_model_with_balanced_growth(community: Community, growth_rat
             new_reaction.add_metabolites({
                 new_metabolite: -1,
             })
-            merged_model.add_reactions([new_reaction])
+            pseudo_reactions.append(new_reaction)
 
             reaction.lower_bound = 0
 
+    # Add all pseudo-reactions to model at once
+    merged_model.add_reactions(pseudo_reactions)
+
     # Set merged model's objective to community biomass
     merged_model.add_reactions([community_biomass_reaction])
     merged_model.objective = "COMMUNITY_BIOMASS"
@@ -785,40 +883,49 @@ def split_reversible_organism_reactions(model: cobra.Model, organism_id_biomass_
     * organism_id_biomass_reaction_mapping: Dict[str, str] ~ A dictionary with the community model's organism IDs
       as keys, and the corresponding biomass reaction IDs as values
     """
+    biomass_reaction_ids = set(organism_id_biomass_reaction_mapping.values())
+    organism_ids = set(organism_id_biomass_reaction_mapping.keys())
+    new_reactions: List[cobra.Reaction] = []
+    reactions_with_forward_ids: List[Tuple[cobra.Reaction, str]] = []
     for reaction in model.reactions:
         # Skip irreversible reactions
         if reaction.lower_bound >= 0:
             continue
         # Skip biomass reactions
-        if reaction.id in organism_id_biomass_reaction_mapping.values():
+        if reaction.id in biomass_reaction_ids:
             continue
 
         # Get biomass ID of the reaction using the commmodelpy standard naming scheme
-        organism_id = reaction.id.split("_")[-1]
+        # (a single right-side partition yields the same parts as a full split and join, even for IDs without "_")
+        base_reaction_id, _, organism_id = reaction.id.rpartition("_")
         # Skip reaction if it is not part of the organisms (i.e., it is either an ignored
         # organism or part of the exchange compartment)
-        if organism_id not in organism_id_biomass_reaction_mapping.keys():
+        if organism_id not in organism_ids:
             continue
 
         # Create new reaction as described in main comment
-        new_reaction = copy.deepcopy(reaction)
+        # (a fresh reaction which refers to the model's metabolites is much cheaper than a deepcopy of the original one)
         original_lower_bound = reaction.lower_bound
-        reaction_id_split = reaction.id.split("_")
-        reaction.id = "_".join(
-            reaction_id_split[:-1]) + "_forward_" + reaction_id_split[-1]
-        new_reaction.id = "_".join(
-            reaction_id_split[:-1]) + "_reverse_" + reaction_id_split[-1]
+        new_reaction = cobra.Reaction(id=f"{base_reaction_id}_reverse_{organism_id}",
+                                      name=reaction.name,
+                                      subsystem=reaction.subsystem,
+                                      lower_bound=0,
+                                      upper_bound=-original_lower_bound)
+        new_reaction.gene_reaction_rule = reaction.gene_reaction_rule
+        new_reaction.notes = copy.deepcopy(reaction.notes)
+        new_reaction.annotation = copy.deepcopy(reaction.annotation)
+        reactions_with_forward_ids.append((reaction, f"{base_reaction_id}_forward_{organism_id}"))
         reaction.lower_bound = 0
-        new_reaction.lower_bound = 0
-        new_reaction.upper_bound = -original_lower_bound
 
         # Reverse direction of products and educts in reverse reaction
-        new_reaction_metabolites_copy = copy.deepcopy(new_reaction.metabolites)
-        for key in list(new_reaction_metabolites_copy.keys()):
-            new_reaction_metabolites_copy[key] *= -2
+        new_reaction.add_metabolites({
+            metabolite: -coefficient for metabolite, coefficient in reaction.metabolites.items()
+        })
+
+        new_reactions.append(new_reaction)
 
-        # Add new reaction to model
-        new_reaction.add_metabolites(new_reaction_metabolites_copy)
-        model.add_reactions([new_reaction])
+    # Rename all original reactions to forward reactions and add all new reverse reactions to model at once
+    _set_reaction_ids(model, reactions_with_forward_ids)
+    model.add_reactions(new_reactions)
 
     return model
@@ -25,7 +25,13 @@ import json
 import os
 import pickle
 import sys
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+# Optional external modules
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # CONSTANT SECTION
@@ -36,6 +42,9 @@ UNIPROT_UPLOADLISTS_URL = "https://www.uniprot.org/uploadlists"
 # UNIPROT_URL represents the UniProtKB database search URL. After this string, the parameters are appended
 # (e.g. a UniProt ID to refer to the protein's entry).
 UNIPROT_URL = "https://www.uniprot.org/uniprot"
+# SANITIZE_PATH_TRANSLATION_TABLE maps all characters which are invalid in paths to "_". It is used
+# by sanitize_path() so that all characters are replaced in a single pass over the given string.
+SANITIZE_PATH_TRANSLATION_TABLE = str.maketrans({character: "_" for character in "\\/:*<>|"})
 
 
 # PUBLIC FUNCTIONS SECTION
@@ -67,18 +76,22 @@ def ensure_folder_existence(folder: str) -> None:
     ----------
     * folder: str ~ The folder whose existence shall be enforced.
     """
-    if os.path.isdir(folder):
-        return
-    os.makedirs(folder)
+    os.makedirs(folder, exist_ok=True)
 
 
-def get_files(path: str) -> List[str]:
+def get_files(path: str, recursive: bool = True) -> List[str]:
     """Returns the names of the files in the given folder as a list of strings.
 
     Arguments
     ----------
     * path: str ~ The path to the folder of which the file names shall be returned
+    * recursive: bool = True ~ If True, the names of the files in all subfolders are returned, too.
+      If False, only the given folder itself is scanned (with a single os.scandir call).
     """
+    if not recursive:
+        with os.scandir(path) as entries:
+            return [entry.name for entry in entries if entry.is_file()]
+
     files: List[str] = []
     for (_, _, filenames) in os.walk(path):
         files.extend(filenames)
@@ -95,41 +108,65 @@ def get_float_cell_value(cell_value) -> float:
     ----------
     * cell_value ~ The openpyxl cell value
     """
-    if type(cell_value) not in (int, float):
-        cell_value = cell_value.replace(",", ".")
-        cell_value = float(cell_value)
-    return cell_value
+    # Numeric cells (the common case) are returned directly
+    if isinstance(cell_value, (int, float)):
+        return cell_value
+    return float(cell_value.replace(",", "."))
+
 
+def is_fitting_ec_number_parts(ec_number_one_parts: Tuple[str, ...], ec_number_two_parts: Tuple[str, ...],
+                               wildcard_level: int) -> bool:
+    """Check whether the already split EC numbers are the same under the used wildcard level.
 
+    In contrast to is_fitting_ec_numbers(), the EC numbers are given as tuples of their single numbers
+    (as returned by split_ec_number()), so that callers which compare many EC number pairs have to split
+    each EC number only once.
+
+    Arguments
+    ----------
+    * ec_number_one_parts: Tuple[str, ...] ~ The single numbers of the first given EC number.
+    * ec_number_two_parts: Tuple[str, ...] ~ The single numbers of the second given EC number.
+    * wildcard_level: int ~ The wildcard level.
+    """
+    if wildcard_level == 0:
+        return ec_number_one_parts == ec_number_two_parts
+    return ec_number_one_parts[:-wildcard_level] == ec_number_two_parts[:-wildcard_level]
+
+
+@lru_cache(maxsize=4096)
 def is_fitting_ec_numbers(ec_number_one: str, ec_number_two: str, wildcard_level: int) -> bool:
     """Check whether the EC numbers are the same under the used wildcard level.
 
+    As this check is pure and typically repeated for the same EC number pairs, its results are cached.
+
     Arguments
     ----------
     * ec_number_one: str ~ The first given EC number.
     * ec_number_two: str ~ The second given EC number.
     * wildcard_level: int ~ The wildcard level.
     """
-    if wildcard_level == 0:
-        ec_number_one_full_numbers = ec_number_one.split(".")
-        ec_number_two_full_numbers = ec_number_two.split(".")
-    else:
-        ec_number_one_full_numbers = ec_number_one.split(".")[:-wildcard_level]
-        ec_number_two_full_numbers = ec_number_two.split(".")[:-wildcard_level]
-
-    if ec_number_one_full_numbers == ec_number_two_full_numbers:
-        return True
-    else:
-        return False
+    return is_fitting_ec_number_parts(split_ec_number(ec_number_one), split_ec_number(ec_number_two), wildcard_level)
 
 
 def json_load(path: str) -> Dict[Any, Any]:
     """Loads the given JSON file and returns it as dictionary.
 
+    If the optional orjson package is installed, it is used for faster parsing. For JSON files
+    which orjson does not accept (e.g. with NaN or Infinity values written by Python's json module),
+    Python's json module is used as fallback.
+
     Arguments
     ----------
     * path: str ~ The path of the JSON file
     """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            json_bytes = f.read()
+        try:
+            return orjson.loads(json_bytes)
+        except orjson.JSONDecodeError:
+            return json.loads(json_bytes)
+
     with open(path) as f:
         dictionary = json.load(f)
     return dictionary
@@ -144,9 +181,9 @@ def json_write(path: str, dictionary: Dict[Any, Any]) -> None:
     * dictionary: Dict[Any, Any] ~ The dictionary which shalll be the content of
       the created JSON file
     """
-    json_output = json.dumps(dictionary, indent=4)
+    # The JSON text is streamed into the file instead of being built as one big string first
     with open(path, "w", encoding="utf-8") as f:
-        f.write(json_output)
+        json.dump(dictionary, f, indent=4)
 
 
 def pickle_load(path: str) -> Any:
@@ -156,36 +193,39 @@ def pickle_load(path: str) -> Any:
     ----------
     * path: str ~ The path to the pickle file.
     """
-    pickle_file = open(path, 'rb')
-    pickled_object = pickle.load(pickle_file)
-    pickle_file.close()
+    with open(path, "rb") as pickle_file:
+        pickled_object = pickle.load(pickle_file)
     return pickled_object
 
 
 def pickle_write(path: str, pickled_object: Any) -> None:
     """Writes the given object as pickled file with the given path
 
+    The highest pickle protocol of the running Python version is used, as it is the fastest one and
+    the most compact one (e.g., for large NumPy arrays).
+
     Arguments
     ----------
     * path: str ~ The path of the pickled file that shall be created
     * pickled_object: Any ~ The object which shall be saved in the pickle file
     """
-    pickle_file = open(path, 'wb')
-    pickle.dump(pickled_object, pickle_file)
-    pickle_file.close()
+    with open(path, "wb") as pickle_file:
+        pickle.dump(pickled_object, pickle_file, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def mkdir(path: str) -> None:
     """Creates a directory if the given directory does not exist yet.
 
-    Uses os.mkdir and os.path.exists internally.
+    Uses os.mkdir internally, i.e., parent directories are not created.
 
     Argument
     ----------
     * path: str ~ The directory's path.
     """
-    if not os.path.exists(path):
+    try:
         os.mkdir(path)
+    except FileExistsError:
+        pass
 
 
 def resolve_pathway_ids(pathway_ids: str, pathways: List[Any]) -> List[int]:
@@ -226,10 +266,17 @@ def sanitize_path(text: str) -> str:
     ----------
     * text: str ~ The string that may contain invalid characters.
     """
-    return text.replace("\\", "_").replace("/", "_").\
-        replace(":", "_").replace("*", "_").\
-        replace("<", "_").replace(">", "_").\
-        replace("|", "_")
+    return text.translate(SANITIZE_PATH_TRANSLATION_TABLE)
+
+
+def split_ec_number(ec_number: str) -> Tuple[str, ...]:
+    """Returns the single numbers of the given EC number as tuple, e.g. ("1", "1", "1", "1") for "1.1.1.1".
+
+    Arguments
+    ----------
+    * ec_number: str ~ The EC number which shall be split.
+    """
+    return tuple(ec_number.split("."))
 
 
 def standardize_folder(folder: str) -> str:
@@ -242,6 +289,10 @@ def standardize_folder(folder: str) -> str:
     ----------
     * folder: str ~ The folder path that shall be standardized.
     """
+    # Return already standardized folder paths directly without creating new strings.
+    if folder.endswith("/") and ("\\" not in folder):
+        return folder
+
     # Standardize for \ or / as path separator character.
     folder = folder.replace("\\", "/")
 
@@ -31,9 +31,9 @@ model = cobra.io.read_sbml_model(
 print("Read out BiGG IDs and associated MetaNetX IDs as given in iML1515's reactions, thereby creating the mapping...")
 bigg_id_metanetx_id_mapping: Dict[str, Dict[str, str]] = {}
 for metabolite in model.metabolites:
-    if ("bigg.metabolite" in metabolite.annotation.keys()) and ("metanetx.chemical" in metabolite.annotation.keys()):
+    if ("bigg.metabolite" in metabolite.annotation) and ("metanetx.chemical" in metabolite.annotation):
         bigg_id = metabolite.annotation["bigg.metabolite"]
-        if bigg_id not in bigg_id_metanetx_id_mapping.keys():
+        if bigg_id not in bigg_id_metanetx_id_mapping:
             bigg_id_metanetx_id_mapping[bigg_id] = {}
 
             if "_" in bigg_id:
@@ -84,7 +84,7 @@ def create_reaction_id_to_dG0_mapping_json(model: cobra.Model, json_path: str) -
             if base_metabolite_id.endswith("BIO"):
                 base_metabolite_id = base_metabolite_id[:-len("BIO")]
 
-            if base_metabolite_id not in bigg_id_to_metanetx_id.keys():
+            if base_metabolite_id not in bigg_id_to_metanetx_id:
                 is_metanetx_id_missing = True
                 break
 
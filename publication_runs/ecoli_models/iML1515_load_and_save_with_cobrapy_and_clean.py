@@ -28,6 +28,24 @@ References:
 """
 # IMPORT SECTION
 import cobra
+import numpy as np
+import re
+
+
+# CONSTANTS SECTION
+# Wrong ID parts of the original SBML and their replacements
+WRONG_ID_PART_REPLACEMENTS = {
+    "_DASH_": "__",
+    "_LPAREN_": "_",
+    "_RPAREN_": "",
+}
+WRONG_ID_PART_PATTERN = re.compile("|".join(WRONG_ID_PART_REPLACEMENTS.keys()))
+
+
+# FUNCTIONS SECTION
+def clean_id(id_string: str) -> str:
+    """Returns the given ID with all wrong ID parts replaced in a single scan."""
+    return WRONG_ID_PART_PATTERN.sub(lambda match: WRONG_ID_PART_REPLACEMENTS[match.group(0)], id_string)
 
 
 # ACTUAL ROUTINE SECTION
@@ -37,44 +55,41 @@ print("Load original iML1515 SBML...")
 model = cobra.io.read_sbml_model("./publication_runs/ecoli_models/original_sbml_models/iML1515.xml")
 
 print("Set -1000/1000 bounds to -inf/inf...")
-for reaction in model.reactions:
-    if reaction.upper_bound >= 1000:
-        reaction.upper_bound = float("inf")
-    if reaction.lower_bound <= -1000:
-        reaction.lower_bound = -float("inf")
+lower_bounds = np.fromiter((x.lower_bound for x in model.reactions), dtype=float, count=len(model.reactions))
+upper_bounds = np.fromiter((x.upper_bound for x in model.reactions), dtype=float, count=len(model.reactions))
+new_lower_bounds = np.where(lower_bounds <= -1000, -np.inf, lower_bounds)
+new_upper_bounds = np.where(upper_bounds >= 1000, np.inf, upper_bounds)
+# Only touch reactions with changed bounds, and set both bounds at once
+changed_indices = np.flatnonzero((new_lower_bounds != lower_bounds) | (new_upper_bounds != upper_bounds))
+for index in changed_indices:
+    model.reactions[index].bounds = (float(new_lower_bounds[index]), float(new_upper_bounds[index]))
 
-print("Cleaning reaction ID parts...")
-for reaction in model.reactions:
-    if "_DASH_" in reaction.id:
-        reaction.id = reaction.id.replace("_DASH_", "__")
-    if "_LPAREN_" in reaction.id:
-        reaction.id = reaction.id.replace("_LPAREN_", "_")
-    if "_RPAREN_" in reaction.id:
-        reaction.id = reaction.id.replace("_RPAREN_", "")
-
-print("Delete boundary-condition-free exchange metabolites...")
-metabolite_ids = [x.id for x in model.metabolites]
-for metabolite_id in metabolite_ids:
+print("Delete boundary-condition-free exchange metabolites and rename wrong metabolite name parts...")
+# Single pass over all metabolites: boundary-condition-free exchange metabolites
+# are collected for deletion, all other ones are cleaned
+exchange_metabolites = []
+for metabolite in model.metabolites:
+    metabolite_id = metabolite.id
     if metabolite_id.endswith("_ex"):
-        metabolite_instance = model.metabolites.get_by_id(metabolite_id)
-        model.remove_metabolites([metabolite_instance])
-
-print("Remove exchange metabolite reactions...")
-reaction_ids = [x.id for x in model.reactions]
-for reaction_id in reaction_ids:
-    reaction = model.reactions.get_by_id(reaction_id)
-    if reaction.metabolites == {}:
-        model.remove_reactions([reaction])
+        exchange_metabolites.append(metabolite)
         continue
+    cleaned_id = clean_id(metabolite_id)
+    if cleaned_id != metabolite_id:
+        metabolite.id = cleaned_id
+model.remove_metabolites(exchange_metabolites)
 
-print("Rename wrong metabolite name parts...")
-for metabolite in model.metabolites:
-    if "_DASH_" in metabolite.id:
-        metabolite.id = metabolite.id.replace("_DASH_", "__")
-    if "_LPAREN_" in metabolite.id:
-        metabolite.id = metabolite.id.replace("_LPAREN_", "_")
-    if "_RPAREN_" in metabolite.id:
-        metabolite.id = metabolite.id.replace("_RPAREN_", "")
+print("Cleaning reaction ID parts and remove exchange metabolite reactions...")
+# Single pass over all reactions: IDs are cleaned and reactions which became
+# empty through the exchange metabolite deletion are collected for removal
+empty_reactions = []
+for reaction in model.reactions:
+    reaction_id = reaction.id
+    cleaned_id = clean_id(reaction_id)
+    if cleaned_id != reaction_id:
+        reaction.id = cleaned_id
+    if reaction.metabolites == {}:
+        empty_reactions.append(reaction)
+model.remove_reactions(empty_reactions)
 
 print("Deactivate all C sources except of D-glucose...")
 model.reactions.EX_succ_e.lower_bound = 0
@@ -86,15 +101,16 @@ with model:
     print("Single model FBA solution:")
     fba_solution = model.optimize()
     print(model.summary())
-    for reaction in model.reactions:
-        if not reaction.id.startswith("EX_"):
-            continue
-        if fba_solution.fluxes[reaction.id] != 0:
-            print(f"{reaction.id}: {fba_solution.fluxes[reaction.id] }")
+    flux_dict = fba_solution.fluxes.to_dict()
+    for reaction_id, flux in flux_dict.items():
+        if reaction_id.startswith("EX_") and (flux != 0):
+            print(f"{reaction_id}: {flux}")
     print("~~~")
 
 print("Save iML1515 model...")
 cobra.io.write_sbml_model(model, "./publication_runs/ecoli_models/original_sbml_models_in_cleaned_form/iML1515_loaded_and_saved_by_cobrapy_cleaned.xml")
+# The JSON version is much faster to load than the SBML in the community model generation script
+cobra.io.save_json_model(model, "./publication_runs/ecoli_models/original_sbml_models_in_cleaned_form/iML1515_loaded_and_saved_by_cobrapy_cleaned.json")
 
 print("Done!")
 print("")
@@ -22,16 +22,32 @@ more detail in commmodelpy's publication.
 # IMPORT SECTION
 # External modules
 import cobra
-import copy
-from typing import Dict
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from itertools import chain
+from typing import Dict, Tuple
 # Internal modules
 from commmodelpy.commmodelpy import Community, SingleModel, generate_community_model_with_no_growth
 from commmodelpy.submodules.helper_general import json_write, json_load
 
 
+def strip_compartment_suffix(metabolite_id: str, compartment_suffixes: Tuple[str, ...] = ("_p", "_c")) -> str:
+    """Returns the given metabolite ID without its trailing compartment suffix (if it ends with one of the given ones)."""
+    for compartment_suffix in compartment_suffixes:
+        if metabolite_id.endswith(compartment_suffix):
+            return metabolite_id[:-len(compartment_suffix)]
+    return metabolite_id
+
+
 # ecolicore double model
 # with internal exchanges for everything in the periplasm
-ecoli_model = cobra.io.read_sbml_model("publication_runs/ecoli_models/original_sbml_models_in_cleaned_form/iML1515_loaded_and_saved_by_cobrapy_cleaned.xml")
+# (the JSON version written by the iML1515 load and save script is preferred as it loads much faster)
+cleaned_model_path = "./publication_runs/ecoli_models/original_sbml_models_in_cleaned_form/iML1515_loaded_and_saved_by_cobrapy_cleaned"
+if os.path.isfile(cleaned_model_path+".json"):
+    ecoli_model = cobra.io.load_json_model(cleaned_model_path+".json")
+else:
+    ecoli_model = cobra.io.read_sbml_model(cleaned_model_path+".xml")
 
 # Define essential and periplasmic metabolites (essential metabolites
 # were found by FBAs beforehand)
@@ -81,18 +97,18 @@ essential_out_metabolites = [
     # Quasi "demand metabolite"
     "meoh_p",
 ]
-all_essential_metabolites = list(set(essential_in_metabolites+essential_out_metabolites))
+# (only used for membership tests and for precomputations, hence a frozenset)
+all_essential_metabolites = frozenset(essential_in_metabolites) | frozenset(essential_out_metabolites)
 essential_metabolite_mapping: Dict[str, str] = {}
 for met in essential_in_metabolites+essential_out_metabolites:
-    essential_metabolite_mapping[met] = (met+"\b").replace("_e\b", "").replace("_p\b", "").replace("_c\b", "")
+    essential_metabolite_mapping[met] = strip_compartment_suffix(met, ("_e", "_p", "_c"))
 
 periplasmic_metabolites = [x for x in ecoli_model.metabolites if x.id.endswith("_p")]
-periplasmic_metabolites_cut = [(x.id+"\b").replace("_p\b", "") for x in periplasmic_metabolites]
+periplasmic_metabolites_cut = {strip_compartment_suffix(x.id) for x in periplasmic_metabolites}
 periplasmic_metabolites += [x for x in ecoli_model.metabolites
-                            if x.id.endswith("_c") and (((x.id+"\b").replace("_c\b", "") not in periplasmic_metabolites_cut))]
+                            if x.id.endswith("_c") and (strip_compartment_suffix(x.id) not in periplasmic_metabolites_cut)]
 periplasmic_metabolites = [x for x in periplasmic_metabolites
-                           if (((x.id+"\b").replace("_c\b", "_p") not in all_essential_metabolites)) and
-                              (((x.id+"\b").replace("_p\b", "_p") not in all_essential_metabolites))]
+                           if strip_compartment_suffix(x.id)+"_p" not in all_essential_metabolites]
 all_input_metabolite_ids = []
 all_output_metabolite_ids = []
 all_inout_metabolite_ids_mapping: Dict[str, str] = {}
@@ -100,10 +116,10 @@ for periplasmic_metabolite in periplasmic_metabolites:
     metabolite_id = periplasmic_metabolite.id
     all_input_metabolite_ids.append(metabolite_id)
     all_output_metabolite_ids.append(metabolite_id)
-    all_inout_metabolite_ids_mapping[metabolite_id] = (metabolite_id+"\b").replace("_p\b", "").replace("_c\b", "")
+    all_inout_metabolite_ids_mapping[metabolite_id] = strip_compartment_suffix(metabolite_id)
 
-combined_input_metabolite_ids = list(set(all_input_metabolite_ids + essential_in_metabolites + essential_out_metabolites))
-combined_output_metabolite_ids = list(set(all_output_metabolite_ids + essential_out_metabolites + essential_in_metabolites))
+combined_input_metabolite_ids = list(dict.fromkeys(chain(all_input_metabolite_ids, essential_in_metabolites, essential_out_metabolites)))
+combined_output_metabolite_ids = list(dict.fromkeys(chain(all_output_metabolite_ids, essential_out_metabolites, essential_in_metabolites)))
 combined_metabolite_ids_mapping = {**all_inout_metabolite_ids_mapping, **essential_metabolite_mapping}
 
 # Define commmodelpy SingleModel
@@ -117,20 +133,21 @@ ecoli_1 = SingleModel(
     model_metabolite_to_exchange_id_mapping=combined_metabolite_ids_mapping,
 )
 # Double it :D
-ecoli_2 = copy.deepcopy(ecoli_1)
-ecoli_2.species_abbreviation = "ecoli2"
+# (only the cobra model is copied, using cobrapy's own model copy; the ID lists and the
+# mapping are only read during the community model generation and can thus be shared)
+ecoli_2 = replace(ecoli_1, cobra_model=ecoli_model.copy(), species_abbreviation="ecoli2")
 
 # Create community model :D
 print("===\nGeneration of community model...")
-potential_product_metabolites = [x for x in periplasmic_metabolites]
-potential_product_metabolite_ids = [(x.id+"\b").replace("_p\b", "").replace("_c\b", "") for x in potential_product_metabolites]
+# The mapping already contains the stripped IDs of all periplasmic metabolites
+potential_product_metabolite_ids = list(all_inout_metabolite_ids_mapping.values())
 
 community = Community(
     single_models=[ecoli_1, ecoli_2],
     exchange_compartment_id="exchg",
     exchange_reaction_id_prefix="EX_C_",
-    input_metabolite_ids=[(x+"\b").replace("_p\b", "").replace("_c\b", "").replace("\b", "") for x in essential_in_metabolites],
-    output_metabolite_ids=[(x+"\b").replace("_p\b", "").replace("_c\b", "").replace("\b", "") for x in essential_out_metabolites+potential_product_metabolite_ids]
+    input_metabolite_ids=[strip_compartment_suffix(x) for x in essential_in_metabolites],
+    output_metabolite_ids=[strip_compartment_suffix(x) for x in essential_out_metabolites]+potential_product_metabolite_ids
 )
 community_model = generate_community_model_with_no_growth(community, {"ecoli1": 0.5, "ecoli2": 0.5})
 
@@ -139,38 +156,45 @@ dG0_data_dict = json_load("./publication_runs/ecoli_models/model_reaction_id_to_
 
 
 thermodynamically_excluded_metabolites = ["h2o", "h"]
+# Precompute the exchange compartment metabolite IDs which are checked for every exchange reaction
+excluded_tails = frozenset(thermodynamically_excluded_metabolites)
+essential_tails = frozenset(strip_compartment_suffix(x) for x in all_essential_metabolites)
+essential_exchg_suffixes = tuple(x+"_exchg" for x in essential_tails)
+deactivated_reactions = []
+new_dG0_entries: Dict[str, Dict[str, float]] = {}
 for reaction in community_model.reactions:
-    if reaction.id.startswith("EXCHG_"):
-        exclude_reaction = False
-        for excluded_metabolite in thermodynamically_excluded_metabolites:
-            if reaction.id.endswith("_to_"+excluded_metabolite):
-                exclude_reaction = True
-        if not exclude_reaction:
-            dG0_data_dict[reaction.id] = {}
-            dG0_data_dict[reaction.id]["dG0"] = 0
-            dG0_data_dict[reaction.id]["uncertainty"] = 0
-        is_essential = False
-        for essential_metabolite in all_essential_metabolites:
-            if reaction.id.endswith("_to_"+(essential_metabolite+"\b").replace("_p\b", "").replace("_c\b", "")):
-                is_essential = True
-                break
-        if is_essential:
+    reaction_id = reaction.id
+    # Most reactions are internal ones, which are skipped with a single check
+    if not reaction_id.startswith(("EXCHG_", "EX_C")):
+        continue
+    # The third character distinguishes "EXCHG_" from "EX_C"
+    if reaction_id[2] == "C":
+        # EXCHG_ reaction IDs end with "_to_" plus their exchange compartment metabolite ID
+        tail = reaction_id.rsplit("_to_", 1)[-1]
+        if tail not in excluded_tails:
+            new_dG0_entries[reaction_id] = {"dG0": 0, "uncertainty": 0}
+        if tail in essential_tails:
             continue
-        reaction.lower_bound = 0
-        reaction.upper_bound = 0
-    elif reaction.id.startswith("EX_C"):
-        is_essential = False
-        for essential_metabolite in all_essential_metabolites:
-            if reaction.id.endswith((essential_metabolite+"\b").replace("_p\b", "_exchg").replace("_c\b", "_exchg")):
-                is_essential = True
-                break
-        if is_essential:
+        deactivated_reactions.append(reaction)
+    else:
+        if reaction_id.endswith(essential_exchg_suffixes):
             continue
-        reaction.lower_bound = 0
-        reaction.upper_bound = 0
+        deactivated_reactions.append(reaction)
+dG0_data_dict.update(new_dG0_entries)
+# Deactivate all non-essential exchanges with one bounds update per reaction
+for reaction in deactivated_reactions:
+    reaction.bounds = (0, 0)
 
 print("Done!")
 
 # Store model as SBML :D
-cobra.io.write_sbml_model(community_model, "./publication_runs/ecoli_models/publication_sbmls_and_dG0_jsons/iML1515double_model.xml")
-json_write("./publication_runs/ecoli_models/publication_sbmls_and_dG0_jsons/iML1515double_dG0.json", dG0_data_dict)
+# (in a background thread, as the model is not changed anymore and the dG0 JSON is written independently;
+# future.result() re-raises any error of the SBML writing so that the script does not silently succeed)
+with ThreadPoolExecutor(max_workers=1) as executor:
+    sbml_writing_future = executor.submit(
+        cobra.io.write_sbml_model,
+        community_model,
+        "./publication_runs/ecoli_models/publication_sbmls_and_dG0_jsons/iML1515double_model.xml",
+    )
+    json_write("./publication_runs/ecoli_models/publication_sbmls_and_dG0_jsons/iML1515double_dG0.json", dG0_data_dict)
+    sbml_writing_future.result()
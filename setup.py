@@ -1,16 +1,12 @@
 import setuptools
 
-with open("README.md", "r") as fh:
-    long_description = fh.read()
-
+# The long description is read from README.md by setuptools itself (see setup.cfg)
 setuptools.setup(
     name="commmodelpy",
     version="0.0.3",
     author="Paulocracy",
     author_email="bekiaris@mpi-magdeburg.mpg.de",
     description="The commmodelpy package",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
     url="https://github.com/ARB-Lab/commmodelpy",
     packages=setuptools.find_packages(),
     classifiers=[
@@ -22,4 +18,8 @@ setuptools.setup(
     install_requires=[
         "cobra",
     ],
+    extras_require={
+        # Faster JSON reading in commmodelpy.submodules.helper_general
+        "orjson": ["orjson"],
+    },
 )